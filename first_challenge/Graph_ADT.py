@@ -1,26 +1,173 @@
 import math
 import heapq
-import networkx as nx
-import matplotlib.pyplot as plt
-import matplotlib
-from io import BytesIO
-import base64
-matplotlib.use('Agg')
+from collections import deque
+import numpy as np
+
+# networkx y matplotlib pesan varios MB y tardan en importar, asi que
+# solo se cargan dentro de visualize/draw_graph cuando se necesitan
+_agg_configured = False
+
+
+def _configure_matplotlib():
+    """
+    Configura el backend Agg de matplotlib (sin ventanas) una sola vez.
+    """
+    global _agg_configured
+    if not _agg_configured:
+        import matplotlib
+        matplotlib.use('Agg')
+        _agg_configured = True
+
+
+# Numba es opcional: si esta instalado, los recorridos sobre CSR se
+# compilan a codigo nativo; si no, se usan las versiones en Python puro.
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
 
 # Para crear un TDA de grafos simples, es necesario primero saber de que esta compuesto un grafo simple
 # Un grafo simple esta compuesto por un conjunto de vertices y un conjunto de aristas
 # Por ende para modelar el TDA es necesario entenderlo como una clase que contenga una lista de adyacencia
 # Con lista de adyasencia me refiero a una lista de listas, donde cada lista interna representa un vertice
 
+def _bfs_csr(indptr, indices, start, n):
+    """
+    Recorrido BFS sobre el grafo en formato CSR, escrito solo con
+    arreglos de numpy para que Numba lo pueda compilar.
+
+    Args:
+    indptr (ndarray): Los limites de las aristas de cada vertice.
+    indices (ndarray): Los vertices destino de cada arista.
+    start (int): El id entero del vertice de inicio.
+    n (int): La cantidad de vertices del grafo.
+
+    Returns:
+    ndarray: Los ids de los vertices en el orden en el que fueron visitados.
+    """
+    order = np.empty(n, dtype=np.int32)
+    visited = np.zeros(n, dtype=np.uint8)
+    queue = np.empty(n, dtype=np.int32)
+    head = 0
+    tail = 1
+    queue[0] = start
+    visited[start] = 1
+    count = 0
+
+    while head < tail:
+        vertex = queue[head]
+        head += 1
+        order[count] = vertex
+        count += 1
+        for edge in range(indptr[vertex], indptr[vertex + 1]):
+            neighbor = indices[edge]
+            if visited[neighbor] == 0:
+                visited[neighbor] = 1
+                queue[tail] = neighbor
+                tail += 1
+    return order[:count]
+
+
+def _dijkstra_csr(indptr, indices, weights, start, end, n):
+    """
+    Algoritmo de Dijkstra sobre el grafo en formato CSR, con un heap
+    binario implementado sobre arreglos de numpy para que Numba lo
+    pueda compilar.
+
+    Args:
+    indptr (ndarray): Los limites de las aristas de cada vertice.
+    indices (ndarray): Los vertices destino de cada arista.
+    weights (ndarray): Los pesos de cada arista.
+    start (int): El id entero del vertice de inicio.
+    end (int): El id entero del vertice de fin.
+    n (int): La cantidad de vertices del grafo.
+
+    Returns:
+    ndarray: El padre de cada vertice en el arbol de caminos mas cortos
+        (-1 si el vertice no fue alcanzado).
+    """
+    dist = np.full(n, np.inf)
+    parent = np.full(n, -1, dtype=np.int32)
+
+    # Heap binario (distancia, vertice) en arreglos paralelos; el heap
+    # perezoso inserta a lo sumo una entrada por arista mas la inicial
+    capacity = indptr[-1] + 1
+    heap_dist = np.empty(capacity, dtype=np.float64)
+    heap_vertex = np.empty(capacity, dtype=np.int32)
+    heap_dist[0] = 0.0
+    heap_vertex[0] = start
+    size = 1
+    dist[start] = 0.0
+
+    while size > 0:
+        distance = heap_dist[0]
+        vertex = heap_vertex[0]
+
+        # Extraer el minimo: mover el ultimo a la raiz y hundirlo
+        size -= 1
+        heap_dist[0] = heap_dist[size]
+        heap_vertex[0] = heap_vertex[size]
+        i = 0
+        while True:
+            left = 2 * i + 1
+            right = left + 1
+            smallest = i
+            if left < size and heap_dist[left] < heap_dist[smallest]:
+                smallest = left
+            if right < size and heap_dist[right] < heap_dist[smallest]:
+                smallest = right
+            if smallest == i:
+                break
+            heap_dist[i], heap_dist[smallest] = heap_dist[smallest], heap_dist[i]
+            heap_vertex[i], heap_vertex[smallest] = heap_vertex[smallest], heap_vertex[i]
+            i = smallest
+
+        # Entrada obsoleta: ya se conoce un camino mas corto
+        if distance > dist[vertex]:
+            continue
+        if vertex == end:
+            break
+
+        for edge in range(indptr[vertex], indptr[vertex + 1]):
+            neighbor = indices[edge]
+            alternative = distance + weights[edge]
+            if alternative < dist[neighbor]:
+                dist[neighbor] = alternative
+                parent[neighbor] = vertex
+
+                # Insertar (alternative, neighbor) y flotarlo
+                i = size
+                heap_dist[i] = alternative
+                heap_vertex[i] = neighbor
+                size += 1
+                while i > 0:
+                    up = (i - 1) // 2
+                    if heap_dist[up] <= heap_dist[i]:
+                        break
+                    heap_dist[i], heap_dist[up] = heap_dist[up], heap_dist[i]
+                    heap_vertex[i], heap_vertex[up] = heap_vertex[up], heap_vertex[i]
+                    i = up
+    return parent
+
+
+if _HAS_NUMBA:
+    _bfs_csr = njit(cache=True)(_bfs_csr)
+    _dijkstra_csr = njit(cache=True)(_dijkstra_csr)
+
+
 # TDA de Grafos Simples
 
 class Graph:
     """
-    Esta clase representa la estructura de un grafo simple. 
+    Esta clase representa la estructura de un grafo simple.
 
     Attributes:
-        adjacentList (dict): Un diccionario que contiene como llaves los vertices del grafo 
+        neighbors (dict): Un diccionario que contiene como llaves los vertices del grafo
             y como valores una lista de los vertices adyacentes a cada vertice.
+        weights (dict or None): Un diccionario paralelo a neighbors con los pesos de cada
+            arista, en la misma posicion que su vertice adyacente. Es None si el grafo
+            no es ponderado.
 
     Methods:
     addVertex(vertex): Agrega un nuevo vertice al grafo.
@@ -37,9 +184,15 @@ class Graph:
         directed (bool): Indica si el grafo es dirigido o no.
         weighted (bool): Indica si el grafo es ponderado o no.
         """
-        self.adjacentList = {}
+        self.neighbors = {}
+        self.weights = {} if weighted else None
         self.directed = directed
         self.weighted = weighted
+        self._weight_index = {} if weighted else None
+        self._edge_set = set()
+        self._csr = None
+        self._vertex_list = None
+        self._reverse = None
 
     def addVertex(self, vertex):
         """
@@ -48,8 +201,14 @@ class Graph:
         Args:
         vertex (int or str): El vertice a agregar.
         """
-        if vertex not in self.adjacentList:
-            self.adjacentList[vertex] = []
+        if vertex not in self.neighbors:
+            self.neighbors[vertex] = []
+            if self.weighted:
+                self.weights[vertex] = []
+                self._weight_index[vertex] = {}
+            self._csr = None
+            self._vertex_list = None
+            self._reverse = None
 
     def addEdge(self, src, dest, weight=None):
         """
@@ -71,21 +230,34 @@ class Graph:
         ValueError: Si el grafo es ponderado y no se proporciona un peso para la arista.
 
         """
-        if src not in self.adjacentList:
+        if src not in self.neighbors:
             self.addVertex(src)
-        if dest not in self.adjacentList:
+        if dest not in self.neighbors:
             self.addVertex(dest)
 
         if self.weighted and weight is None:
             raise ValueError(
                 "Este grafo es ponderado, se debe proporcionar un peso para la arista.")
-        elif not self.weighted:
-            weight = None
 
-        self.adjacentList[src].append((dest, weight))
+        # Arista duplicada: se ignora para no inflar los recorridos
+        if (src, dest) in self._edge_set:
+            return
+        self._edge_set.add((src, dest))
+
+        self.neighbors[src].append(dest)
+        if self.weighted:
+            self.weights[src].append(weight)
+            self._weight_index[src][dest] = weight
 
         if not self.directed:
-            self.adjacentList[dest].append((src, weight))
+            self._edge_set.add((dest, src))
+            self.neighbors[dest].append(src)
+            if self.weighted:
+                self.weights[dest].append(weight)
+                self._weight_index[dest][src] = weight
+
+        self._csr = None
+        self._reverse = None
 
     def getVertices(self):
         """
@@ -94,7 +266,18 @@ class Graph:
         Returns:
         list: La lista de vertices del grafo.
         """
-        return list(self.adjacentList.keys())
+        if self._vertex_list is None:
+            self._vertex_list = list(self.neighbors.keys())
+        return self._vertex_list
+
+    def iter_vertices(self):
+        """
+        Itera los vertices del grafo sin crear una lista nueva.
+
+        Returns:
+        iterator: Un iterador sobre los vertices del grafo.
+        """
+        return iter(self.neighbors)
 
     def getNeighbors(self, vertex):
         """
@@ -104,9 +287,10 @@ class Graph:
         vertex (any): El vertice del que se quieren obtener los vertices adyacentes.
 
         Returns:
-        list: La lista de vertices adyacentes al vertice dado.
+        list: La lista de vertices adyacentes al vertice dado. Es la
+            lista interna del grafo, no una copia: solo debe leerse.
         """
-        return self.adjacentList[vertex]
+        return self.neighbors[vertex]
 
     def getWeight(self, src, dest):
         """
@@ -119,12 +303,92 @@ class Graph:
         Returns:
         int: El peso de la arista entre los dos vertices dados.
         """
-        for neighbor, weight in self.adjacentList[src]:
-            if neighbor == dest:
-                return weight
+        if not self.weighted:
+            return None
+        return self._weight_index[src].get(dest)
+
+    def _ensure_reverse(self):
+        """
+        Retorna la lista de adyacencia inversa (aristas entrantes) del
+        grafo. Para grafos no dirigidos es la misma lista directa; para
+        grafos dirigidos se construye una sola vez y se guarda en cache,
+        que se invalida al agregar vertices o aristas.
+
+        Returns:
+        tuple: Una tupla (reverse_neighbors, reverse_weights) con la
+            misma estructura paralela que neighbors y weights, donde
+            reverse_weights es None si el grafo no es ponderado.
+        """
+        if not self.directed:
+            return self.neighbors, self.weights
+
+        if self._reverse is None:
+            reverse_neighbors = {vertex: [] for vertex in self.neighbors}
+            if self.weighted:
+                reverse_weights = {vertex: [] for vertex in self.neighbors}
+                for vertex in self.neighbors:
+                    for neighbor, weight in self._edges(vertex):
+                        reverse_neighbors[neighbor].append(vertex)
+                        reverse_weights[neighbor].append(weight)
+            else:
+                reverse_weights = None
+                for vertex in self.neighbors:
+                    for neighbor in self.neighbors[vertex]:
+                        reverse_neighbors[neighbor].append(vertex)
+            self._reverse = (reverse_neighbors, reverse_weights)
+        return self._reverse
+
+    def _edges(self, vertex):
+        """
+        Itera los pares (vecino, peso) de un vertice dado.
+
+        Args:
+        vertex (any): El vertice del que se quieren iterar las aristas.
+
+        Returns:
+        iterator: Un iterador de tuplas (vecino, peso) del vertice dado.
+        """
+        return zip(self.neighbors[vertex], self.weights[vertex])
+
+    def to_csr(self):
+        """
+        Convierte el grafo al formato CSR (Compressed Sparse Row):
+        arreglos contiguos de numpy que recorren las aristas de forma
+        secuencial, mucho mas amigables con la cache que el diccionario
+        de listas. El resultado se guarda en cache y se invalida al
+        agregar vertices o aristas.
+
+        Returns:
+        tuple: Una tupla (indptr, indices, weights, vertex_index) donde
+            las aristas del vertice i son indices[indptr[i]:indptr[i+1]],
+            weights es el arreglo paralelo de pesos (None si el grafo no
+            es ponderado) y vertex_index mapea cada vertice a su id entero.
+        """
+        if self._csr is None:
+            vertex_index = {vertex: i for i, vertex in enumerate(self.neighbors)}
+            n = len(vertex_index)
+
+            # Primer paso: acumular los grados en indptr
+            degrees = np.zeros(n + 1, dtype=np.int64)
+            for vertex, adjacent in self.neighbors.items():
+                degrees[vertex_index[vertex] + 1] = len(adjacent)
+            indptr = np.cumsum(degrees)
+
+            # Segundo paso: llenar los arreglos de aristas ya dimensionados
+            indices = np.empty(indptr[-1], dtype=np.int32)
+            weights = np.empty(indptr[-1], dtype=np.float64) if self.weighted else None
+            for vertex, adjacent in self.neighbors.items():
+                i = vertex_index[vertex]
+                begin, end = indptr[i], indptr[i + 1]
+                indices[begin:end] = [vertex_index[neighbor] for neighbor in adjacent]
+                if self.weighted:
+                    weights[begin:end] = self.weights[vertex]
+
+            self._csr = (indptr, indices, weights, vertex_index)
+        return self._csr
 
     # =================== BFS (Breadth First Search) ===================
-    
+
     def bfs(self, start):
         """
         Realiza un recorrido BFS (Breadth First Search / Busqueda en Anchura) del grafo.
@@ -135,16 +399,26 @@ class Graph:
         Returns:
         list: La lista de vertices en el orden en el que fueron visitados.
         """
-        visited = []
-        queue = [start]
+        # El camino de Numba solo aplica si el vertice existe; si no,
+        # se cae al camino de Python puro para fallar de la misma forma
+        if _HAS_NUMBA and start in self.neighbors:
+            indptr, indices, weights, vertex_index = self.to_csr()
+            vertices = list(vertex_index)
+            order = _bfs_csr(indptr, indices, vertex_index[start], len(vertices))
+            return [vertices[i] for i in order]
+
+        visited = {start}
+        order = []
+        queue = deque([start])
 
         while queue:
-            vertex = queue.pop(0)
-            if vertex not in visited:
-                visited.append(vertex)
-                for neighbor, weight in self.adjacentList[vertex]:
+            vertex = queue.popleft()
+            order.append(vertex)
+            for neighbor in self.neighbors[vertex]:
+                if neighbor not in visited:
+                    visited.add(neighbor)
                     queue.append(neighbor)
-        return visited
+        return order
 
     def bfs_shortest_path(self, start, end):
         """
@@ -158,24 +432,138 @@ class Graph:
         Returns:
         list: La lista de vertices en el orden en el que fueron visitados.
         """
-        visited = []
-        queue = [[start]]
+        if start == end:
+            return [start]
+
+        path = {start: None}
+        queue = deque([start])
         while queue:
-            path = queue.pop(0)
-            vertex = path[-1]
-            if vertex not in visited:
-                visited.append(vertex)
-                for neighbor, weight in self.adjacentList[vertex]:
-                    new_path = list(path)
-                    new_path.append(neighbor)
-                    queue.append(new_path)
+            vertex = queue.popleft()
+            for neighbor in self.neighbors[vertex]:
+                if neighbor not in path:
+                    path[neighbor] = vertex
                     if neighbor == end:
-                        return new_path
-        
+                        # Construir la ruta desde el inicio al destino
+                        current = end
+                        route = [current]
+                        while current != start:
+                            current = path[current]
+                            route.append(current)
+                        route.reverse()
+                        return route
+                    queue.append(neighbor)
+
+    def multi_source_bfs(self, sources):
+        """
+        Realiza un recorrido BFS desde varios vertices de inicio a la
+        vez, expandiendo una frontera compartida nivel por nivel sobre
+        el grafo en formato CSR. Es mas eficiente que ejecutar un bfs
+        por cada fuente cuando solo interesa la distancia a la fuente
+        mas cercana.
+
+        Args:
+        sources (iterable): Los vertices de inicio del recorrido.
+
+        Returns:
+        dict: Un diccionario que mapea cada vertice alcanzado a su
+            distancia (en aristas) a la fuente mas cercana.
+        """
+        indptr, indices, weights, vertex_index = self.to_csr()
+        vertices = list(vertex_index)
+        n = len(vertices)
+
+        dist = np.full(n, -1, dtype=np.int64)
+        frontier = np.unique(np.fromiter(
+            (vertex_index[source] for source in sources), dtype=np.int64))
+        dist[frontier] = 0
+        level = 0
+
+        while frontier.size:
+            # Todos los vecinos de la frontera actual, sin repetidos
+            candidates = np.unique(np.concatenate(
+                [indices[indptr[v]:indptr[v + 1]] for v in frontier]))
+            # Solo los que aun no fueron descubiertos pasan al siguiente nivel
+            frontier = candidates[dist[candidates] == -1]
+            level += 1
+            dist[frontier] = level
+
+        return {vertices[i]: int(dist[i]) for i in range(n) if dist[i] >= 0}
+
+    def _expand_level(self, frontier, parent, other_parent, adjacency):
+        """
+        Expande un nivel completo de una frontera de BFS bidireccional.
+
+        Args:
+        frontier (deque): La frontera a expandir.
+        parent (dict): Los punteros a padres del lado que se expande.
+        other_parent (dict): Los punteros a padres del lado contrario.
+        adjacency (dict): La lista de adyacencia a usar (directa o inversa).
+
+        Returns:
+        any: El vertice donde se encontraron ambas busquedas, o None.
+        """
+        for _ in range(len(frontier)):
+            vertex = frontier.popleft()
+            for neighbor in adjacency[vertex]:
+                if neighbor not in parent:
+                    parent[neighbor] = vertex
+                    if neighbor in other_parent:
+                        return neighbor
+                    frontier.append(neighbor)
+        return None
+
+    def bidirectional_bfs_shortest_path(self, start, end):
+        """
+        Retorna el camino mas corto entre dos vertices dados,
+        utilizando un recorrido BFS bidireccional: se expanden dos
+        fronteras (una desde el inicio y otra desde el fin) y se detiene
+        cuando se encuentran, visitando muchos menos vertices que el BFS
+        desde un solo extremo.
+
+        Args:
+        start (any): El vertice de inicio del recorrido.
+        end (any): El vertice de fin del recorrido.
+
+        Returns:
+        list: La lista de vertices que forman el camino mas corto.
+        """
+        if start == end:
+            return [start]
+
+        reverse, _ = self._ensure_reverse()
+
+        parent_fwd = {start: None}
+        parent_bwd = {end: None}
+        frontier_fwd = deque([start])
+        frontier_bwd = deque([end])
+
+        while frontier_fwd and frontier_bwd:
+            # Se expande siempre la frontera mas pequena
+            if len(frontier_fwd) <= len(frontier_bwd):
+                meeting = self._expand_level(
+                    frontier_fwd, parent_fwd, parent_bwd, self.neighbors)
+            else:
+                meeting = self._expand_level(
+                    frontier_bwd, parent_bwd, parent_fwd, reverse)
+
+            if meeting is not None:
+                # Construir la ruta: mitad hacia el inicio, mitad hacia el fin
+                route = []
+                current = meeting
+                while current is not None:
+                    route.append(current)
+                    current = parent_fwd[current]
+                route.reverse()
+                current = parent_bwd[meeting]
+                while current is not None:
+                    route.append(current)
+                    current = parent_bwd[current]
+                return route
+
     # =====================================================================
-    
+
     # =================== DFS (Depth First Search) ===================
-    
+
     def dfs(self, start, end, avoid):
         """
         Realiza un recorrido DFS (Depth First Search / Busqueda en profundidad) del grafo.
@@ -188,21 +576,28 @@ class Graph:
         Returns:
         list: La lista de vertices en el orden en el que fueron visitados, sin incluir el vértice prohibido.
         """
+        if start == end:
+            return [start]
+
+        # Conjunto de vertices prohibidos (permite extenderlo a varios)
+        avoid_set = frozenset((avoid,))
         path = {start: None}
         stack = [start]
+        found = False
 
-        while stack:
+        while stack and not found:
             vertex = stack.pop()
-            if vertex == end:
-                break
-            for neighbor, weight in self.adjacentList[vertex]:
-                if neighbor == avoid:
+            for neighbor in self.neighbors[vertex]:
+                if neighbor in avoid_set or neighbor in path:
                     continue
-                if neighbor not in path:
-                    path[neighbor] = vertex
-                    stack.append(neighbor)
-
-        if end not in path:
+                path[neighbor] = vertex
+                # Corte temprano: el destino aparecio entre los vecinos
+                if neighbor == end:
+                    found = True
+                    break
+                stack.append(neighbor)
+
+        if not found:
             return []
 
         # Construir la ruta desde el inicio al destino
@@ -215,11 +610,16 @@ class Graph:
 
         return route
 
-    
+
     def dfs_shortest_path(self, start, end):
         """
-        Retorna el camino mas corto entre dos vertices dados,
-        utilizando el algoritmo de DFS (Depth First Search / Busqueda en profundidad)
+        Retorna el camino mas corto entre dos vertices dados.
+
+        Un DFS no garantiza encontrar el camino mas corto (el primer
+        camino que encuentra puede ser arbitrariamente largo), asi que
+        este metodo delega en bfs_shortest_path, que es el algoritmo
+        correcto para caminos mas cortos sin pesos. Se mantiene por
+        compatibilidad con el nombre anterior.
 
         Args:
         start (any): El vertice de inicio del recorrido.
@@ -228,25 +628,12 @@ class Graph:
         Returns:
         list: La lista de vertices en el orden en el que fueron visitados.
         """
-        visited = []
-        stack = [[start]]
-
-        while stack:
-            path = stack.pop()
-            vertex = path[-1]
-            if vertex not in visited:
-                visited.append(vertex)
-                for neighbor, weight in self.adjacentList[vertex]:
-                    new_path = list(path)
-                    new_path.append(neighbor)
-                    stack.append(new_path)
-                    if neighbor == end:
-                        return new_path
-        
+        return self.bfs_shortest_path(start, end)
+
     # =====================================================================
-    
+
     # =================== Dijkstra ===================
-    
+
     def dijkstra(self, start, end):
         """
         Retorna el camino mas corto entre dos vertices dados,
@@ -259,95 +646,210 @@ class Graph:
         Returns:
         list: La lista de vertices en el orden en el que fueron visitados.
         """
-        distances = {}
-        previous = {}
-        queue = []
+        # Vertices desconocidos: se retorna [start] sin buscar, igual
+        # que la version original (la vista pasa texto libre del
+        # formulario directo a este metodo)
+        if start not in self.neighbors or end not in self.neighbors:
+            return [start]
+
+        if _HAS_NUMBA:
+            indptr, indices, weights, vertex_index = self.to_csr()
+            vertices = list(vertex_index)
+            parent = _dijkstra_csr(indptr, indices, weights,
+                                   vertex_index[start], vertex_index[end],
+                                   len(vertices))
+            path = []
+            current = vertex_index[end]
+            while parent[current] != -1:
+                path.append(vertices[current])
+                current = parent[current]
+            result = path[::-1]
+            result.insert(0, start)
+            return result
+
+        infinity = float("inf")
+        distances = {start: 0}
+        previous = {start: None}
+        queue = [(0, start)]
         path = []
-        
-        for vertex in self.adjacentList:
-            if vertex == start:
-                distances[vertex] = 0
-                heapq.heappush(queue, [0, vertex])
-            else:
-                distances[vertex] = float("inf")
-                heapq.heappush(queue, [float("inf"), vertex])
-            previous[vertex] = None
 
         while queue:
-            current = heapq.heappop(queue)[1]
+            distance, current = heapq.heappop(queue)
+            # Entrada obsoleta: ya se conoce un camino mas corto
+            if distance > distances[current]:
+                continue
             if current == end:
-                while previous[current]:
+                while previous[current] is not None:
                     path.append(current)
                     current = previous[current]
                 break
-            if current in self.adjacentList:
-                for neighbor, weight in self.adjacentList[current]:
-                    alternative = distances[current] + weight
-                    if alternative < distances[neighbor]:
-                        distances[neighbor] = alternative
-                        previous[neighbor] = current
-                        for i in range(len(queue)):
-                            if queue[i][1] == neighbor:
-                                queue[i][0] = alternative
-                                break
-                        heapq.heapify(queue)
+            for neighbor, weight in self._edges(current):
+                alternative = distance + weight
+                if alternative < distances.get(neighbor, infinity):
+                    distances[neighbor] = alternative
+                    previous[neighbor] = current
+                    heapq.heappush(queue, (alternative, neighbor))
         result = path[::-1]
         result.insert(0, start)
         return result
-    
-    
+
+
+    def bidirectional_dijkstra(self, start, end):
+        """
+        Retorna el camino mas corto entre dos vertices dados,
+        utilizando el algoritmo de Dijkstra bidireccional: se relajan
+        aristas desde el inicio y desde el fin a la vez, y se detiene
+        cuando la suma de los dos frentes alcanza el mejor camino
+        encontrado, explorando muchas menos aristas que Dijkstra normal.
+
+        Args:
+        start (any): El vertice de inicio del recorrido.
+        end (any): El vertice de fin del recorrido.
+
+        Returns:
+        list: La lista de vertices que forman el camino mas corto.
+        """
+        if start == end:
+            return [start]
+
+        reverse_neighbors, reverse_weights = self._ensure_reverse()
+
+        infinity = float("inf")
+        dist_fwd = {start: 0}
+        dist_bwd = {end: 0}
+        parent_fwd = {start: None}
+        parent_bwd = {end: None}
+        heap_fwd = [(0, start)]
+        heap_bwd = [(0, end)]
+        best = infinity
+        meeting = None
+
+        while heap_fwd and heap_bwd:
+            # Condicion de parada: ningun camino por descubrir puede
+            # mejorar al mejor punto de encuentro ya visto
+            if heap_fwd[0][0] + heap_bwd[0][0] >= best:
+                break
+
+            # Se avanza por el lado con el frente mas cercano
+            if heap_fwd[0][0] <= heap_bwd[0][0]:
+                distance, vertex = heapq.heappop(heap_fwd)
+                if distance > dist_fwd[vertex]:
+                    continue
+                for neighbor, weight in self._edges(vertex):
+                    alternative = distance + weight
+                    if alternative < dist_fwd.get(neighbor, infinity):
+                        dist_fwd[neighbor] = alternative
+                        parent_fwd[neighbor] = vertex
+                        heapq.heappush(heap_fwd, (alternative, neighbor))
+                    if neighbor in dist_bwd:
+                        total = dist_fwd[neighbor] + dist_bwd[neighbor]
+                        if total < best:
+                            best = total
+                            meeting = neighbor
+            else:
+                distance, vertex = heapq.heappop(heap_bwd)
+                if distance > dist_bwd[vertex]:
+                    continue
+                for neighbor, weight in zip(reverse_neighbors[vertex],
+                                            reverse_weights[vertex]):
+                    alternative = distance + weight
+                    if alternative < dist_bwd.get(neighbor, infinity):
+                        dist_bwd[neighbor] = alternative
+                        parent_bwd[neighbor] = vertex
+                        heapq.heappush(heap_bwd, (alternative, neighbor))
+                    if neighbor in dist_fwd:
+                        total = dist_fwd[neighbor] + dist_bwd[neighbor]
+                        if total < best:
+                            best = total
+                            meeting = neighbor
+
+        if meeting is None:
+            return None
+
+        # Construir la ruta: mitad hacia el inicio, mitad hacia el fin
+        route = []
+        current = meeting
+        while current is not None:
+            route.append(current)
+            current = parent_fwd[current]
+        route.reverse()
+        current = parent_bwd[meeting]
+        while current is not None:
+            route.append(current)
+            current = parent_bwd[current]
+        return route
+
+
     def visualize(self):
         """
         Visualiza el grafo utilizando la libreria networkx.
         """
-        g_nx = nx.DiGraph()
+        _configure_matplotlib()
+        import networkx as nx
+        import matplotlib.pyplot as plt
 
-        # Agregamos los nodos al grafo de NetworkX
-        for node in self.getVertices():
-            g_nx.add_node(node)
+        g_nx = nx.DiGraph()
 
-        # Agregamos las aristas al grafo de NetworkX
-        for node in self.getVertices():
-            neighbors = self.getNeighbors(node)
-            for neighbor in neighbors:
-                g_nx.add_edge(node, neighbor[0])
+        # Agregamos los nodos y las aristas al grafo de NetworkX en bloque
+        g_nx.add_nodes_from(self.neighbors)
+        g_nx.add_edges_from(
+            (node, neighbor)
+            for node, adjacent in self.neighbors.items()
+            for neighbor in adjacent)
 
         # Visualizamos el grafo
         nx.draw(g_nx, with_labels=True)
         plt.show()
-        
+
     def draw_graph(self):
         """
         Draw the graph using the NetworkX library with a circular layout.
         """
+        _configure_matplotlib()
+        import networkx as nx
+        import matplotlib.pyplot as plt
+        from io import BytesIO
+        import base64
+
         G = nx.DiGraph() if self.directed else nx.Graph()
 
         # Add vertices
-        G.add_nodes_from(self.getVertices())
-
-        # Add edges
-        for vertex in self.adjacentList:
-            for neighbor, weight in self.adjacentList[vertex]:
-                G.add_edge(vertex, neighbor, weight=weight)
+        G.add_nodes_from(self.neighbors)
+
+        # Add edges in bulk to avoid per-call overhead
+        if self.weighted:
+            G.add_edges_from(
+                (vertex, neighbor, {'weight': weight})
+                for vertex in self.neighbors
+                for neighbor, weight in self._edges(vertex))
+        else:
+            G.add_edges_from(
+                (vertex, neighbor, {'weight': None})
+                for vertex, adjacent in self.neighbors.items()
+                for neighbor in adjacent)
 
         # Use circular layout
         pos = nx.circular_layout(G)
 
+        # Draw on a dedicated figure so repeated calls do not pile up
+        # state in pyplot's global registry
+        fig, ax = plt.subplots()
+
         # Draw nodes and edges
-        nx.draw_networkx_nodes(G, pos, node_size=500)
-        nx.draw_networkx_edges(G, pos)
+        nx.draw_networkx_nodes(G, pos, node_size=500, ax=ax)
+        nx.draw_networkx_edges(G, pos, ax=ax)
 
         # Add node labels
         labels = {v: v for v in G.nodes()}
-        nx.draw_networkx_labels(G, pos, labels)
+        nx.draw_networkx_labels(G, pos, labels, ax=ax)
 
         # Add edge labels
         edge_labels = {(u, v): d['weight'] for u, v, d in G.edges(data=True)}
-        nx.draw_networkx_edge_labels(G, pos, edge_labels=edge_labels)
+        nx.draw_networkx_edge_labels(G, pos, edge_labels=edge_labels, ax=ax)
 
         buffer = BytesIO()
-        plt.savefig(buffer, format="png")
-        plt.clf()
+        fig.savefig(buffer, format="png")
+        plt.close(fig)
 
         image_base64 = base64.b64encode(buffer.getvalue()).decode("utf-8")
         return image_base64
@@ -366,15 +868,13 @@ class Graph:
         Returns:
         str: Una representacion en string del grafo.
         """
-        result = ""
-        for vertex in self.adjacentList:
-            result += f"[{vertex}] -----> "
-            neighbors = []
-            for neighbor, weight in self.adjacentList[vertex]:
-                if weight is not None:
-                    neighbors.append(f"[{neighbor}] [{weight}]")
-                else:
-                    neighbors.append(f"[{neighbor}]")
-            result += ", ".join(neighbors)
-            result += "\n"
-        return result
+        lines = []
+        for vertex in self.neighbors:
+            if self.weighted:
+                neighbors = [f"[{neighbor}] [{weight}]"
+                             for neighbor, weight in self._edges(vertex)]
+            else:
+                neighbors = [f"[{neighbor}]"
+                             for neighbor in self.neighbors[vertex]]
+            lines.append(f"[{vertex}] -----> " + ", ".join(neighbors) + "\n")
+        return "".join(lines)